@@ -6,268 +6,834 @@ Author: Dakotah Martinez
 """
 
 import csv
+import math
+import os
+import sys
 import warnings
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import freeze_support
+from types import SimpleNamespace
 import numpy as np
+from numba import from_dtype, njit, types
 from scipy import optimize
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 warnings.filterwarnings("ignore")
 
 
-def zero_order(inputs, arrhen, e_activ):
-    """
-    Return zero order fit of data.
-
+class FitWarning(UserWarning):
+    """Warning that a fit did not converge or ended on a parameter bound."""
+
+
+warnings.simplefilter("always", FitWarning)
+
+# Every fast-math flag except 'nnan' and 'ninf': the optimizer can wander
+# into overflowing or undefined parameter regions, and those must still
+# come back as inf/nan rather than whatever LLVM assumes instead.
+FASTMATH_FLAGS = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+# numba caches compiled kernels next to this file's source, which a
+# frozen executable does not ship, so compile without caching there.
+CACHE_KERNELS = (not getattr(sys, 'frozen', False)
+                 and os.path.isfile(globals().get('__file__', '')))
+# Floating point type used for fit inputs, model values and Jacobians.
+# float32 halves memory traffic but its ~1e-7 resolution sits above the
+# optimizer's 1e-8 tolerances, so fits take more iterations to converge.
+FIT_DTYPE = np.float64
+# Explicit kernel signatures make numba compile (or load from its cache)
+# every kernel at import time rather than on a model's first use.
+# Inputs are typed read-only so read-only arrays are accepted too.
+_FIT_FLOAT = from_dtype(np.dtype(FIT_DTYPE))
+_FIT_INPUT = types.Array(_FIT_FLOAT, 1, 'C', readonly=True)
+MODEL_KERNEL_SIGNATURE = types.void(_FIT_INPUT, _FIT_INPUT, types.float64,
+                                    types.float64, _FIT_FLOAT[::1])
+JAC_KERNEL_SIGNATURE = types.void(_FIT_INPUT, _FIT_INPUT, types.float64,
+                                  types.float64, _FIT_FLOAT[:, ::1])
+
+
+# Parameters section shared by the docstrings of the model functions.
+_MODEL_PARAMETERS_DOC = """
     Parameters
     ----------
-    inputs : Input parameters for fit (time (seconds), Temp. (Kelvin))
+    inputs : Input parameters for fit (time (seconds),
+             1 / (R * Temp.) (mol/kcal))
     arrhen : Arrhenius prefactor.
     e_activ : Activation energy in kcal/mol.
+    out : Optional array to write the result into, shaped like time.
 
     """
-    time_in, temp = inputs
-    my_k = arrhen * np.exp(-e_activ / (ID_GAS_CONST * temp))
-    return my_k * time_in
 
 
-def first_order(inputs, arrhen, e_activ):
+def _unpack_inputs(inputs):
     """
-    Return first order fit of data.
+    Return (time, 1 / RT) fit inputs as contiguous FIT_DTYPE arrays.
 
-    Parameters
-    ----------
-    inputs : Input parameters for fit (time (seconds), Temp. (Kelvin))
-    arrhen : Arrhenius prefactor.
-    e_activ : Activation energy in kcal/mol.
+    1 / RT may be given per time point or as a single value shared by all
+    of them (isothermal data), in which case the kernels evaluate the
+    rate constant once instead of at every point.
 
     """
-    time_in, temp = inputs
-    my_k = arrhen * np.exp(-e_activ / (ID_GAS_CONST * temp))
-    return 1 - np.exp(-my_k * time_in)
+    time_in, inv_rt = inputs
+    time_in = np.ascontiguousarray(time_in, dtype=FIT_DTYPE).ravel()
+    inv_rt = np.ascontiguousarray(inv_rt, dtype=FIT_DTYPE).ravel()
+    if inv_rt.size not in (1, time_in.size):
+        raise ValueError("1 / RT must have one value or one per time point")
+    return time_in, inv_rt
 
 
-def second_order(inputs, arrhen, e_activ):
+def _model_function(kernel, summary):
     """
-    Return second order fit of data.
+    Return the public model function that evaluates a model kernel.
 
-    Parameters
-    ----------
-    inputs : Input parameters for fit (time (seconds), Temp. (Kelvin))
-    arrhen : Arrhenius prefactor.
-    e_activ : Activation energy in kcal/mol.
+    The function is named after the kernel, e.g. _first_order_kernel gives
+    first_order, so that it pickles by name for the worker processes.
 
     """
-    time_in, temp = inputs
-    my_k = arrhen * np.exp(-e_activ / (ID_GAS_CONST * temp))
-    return (my_k * time_in)/(1 + my_k * time_in)
+    def model(inputs, arrhen, e_activ, out=None):
+        time_in, inv_rt = _unpack_inputs(inputs)
+        if out is None:
+            out = np.empty_like(time_in)
+        elif out.shape != time_in.shape:
+            # The kernels do no bounds checking, so never hand them a
+            # buffer they would write past the end of.
+            raise ValueError("out has shape " + str(out.shape)
+                             + " but the time input has shape "
+                             + str(time_in.shape))
+        kernel(time_in, inv_rt, arrhen, e_activ, out)
+        return out
+    model.__name__ = model.__qualname__ = kernel.__name__[1:-len('_kernel')]
+    model.__doc__ = "\n    " + summary + "\n" + _MODEL_PARAMETERS_DOC
+    return model
+
+
+def _jacobian_function(jac_kernel, label):
+    """
+    Return the public Jacobian function that evaluates a Jacobian kernel.
 
+    Named after the kernel in the same way as _model_function.
 
-def third_order(inputs, arrhen, e_activ):
     """
-    Return third order fit of data.
+    def model_jac(inputs, arrhen, e_activ):
+        time_in, inv_rt = _unpack_inputs(inputs)
+        jac = np.empty((time_in.size, 2), dtype=time_in.dtype)
+        jac_kernel(time_in, inv_rt, arrhen, e_activ, jac)
+        return jac
+    model_jac.__name__ = model_jac.__qualname__ = \
+        jac_kernel.__name__[1:-len('_kernel')]
+    model_jac.__doc__ = ("Return Jacobian of " + label
+                         + " fit w.r.t. (ln arrhen, e_activ).")
+    return model_jac
 
-    Parameters
-    ----------
-    inputs : Input parameters for fit (time (seconds), Temp. (Kelvin))
-    arrhen : Arrhenius prefactor.
-    e_activ : Activation energy in kcal/mol.
 
-    """
-    time_in, temp = inputs
-    my_k = arrhen * np.exp(-1 * e_activ / (ID_GAS_CONST * temp))
-    return 1 - (1 / np.sqrt(np.abs(1 + 2 * my_k * time_in)))
+@njit(inline='always')
+def _rate_constant(inv_rt, i, arrhen, e_activ):
+    """Return 1 / RT at point i and the Arrhenius rate constant there."""
+    my_inv_rt = inv_rt[i]
+    return my_inv_rt, arrhen * math.exp(-e_activ * my_inv_rt)
+
+
+@njit(MODEL_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _zero_order_kernel(time_in, inv_rt, arrhen, e_activ, out):
+    """Fill out with zero order alpha values in one fused loop."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        out[i] = my_kt
 
 
-def avrami_erofeyev_1(inputs, arrhen, e_activ):
-    """
-    Return Avrami Erofeyev 1 fit of data, alpha = 1- exp(-(k * t) ^ 2).
+zero_order = _model_function(
+    _zero_order_kernel, "Return zero order fit of data.")
+
+
+@njit(JAC_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _zero_order_jac_kernel(time_in, inv_rt, arrhen, e_activ, jac):
+    """Fill jac with zero order d(alpha)/d(ln A, Ea) per point."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        dalpha_dlnk = my_kt
+        jac[i, 0] = dalpha_dlnk
+        jac[i, 1] = -dalpha_dlnk * my_inv_rt
 
-    Parameters
-    ----------
-    inputs : Input parameters for fit (time (seconds), Temp. (Kelvin))
-    arrhen : Arrhenius prefactor.
-    e_activ : Activation energy in kcal/mol.
 
-    """
-    time_in, temp = inputs
-    my_k = arrhen * np.exp(-1 * e_activ / (ID_GAS_CONST * temp))
-    return 1 - np.exp(-(my_k * time_in) ** 2)
+zero_order_jac = _jacobian_function(_zero_order_jac_kernel, "zero order")
+
+
+@njit(MODEL_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _first_order_kernel(time_in, inv_rt, arrhen, e_activ, out):
+    """Fill out with first order alpha values in one fused loop."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        out[i] = 1.0 - math.exp(-my_kt)
+
 
+first_order = _model_function(
+    _first_order_kernel, "Return first order fit of data.")
+
+
+@njit(JAC_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _first_order_jac_kernel(time_in, inv_rt, arrhen, e_activ, jac):
+    """Fill jac with first order d(alpha)/d(ln A, Ea) per point."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        dalpha_dlnk = my_kt * math.exp(-my_kt)
+        jac[i, 0] = dalpha_dlnk
+        jac[i, 1] = -dalpha_dlnk * my_inv_rt
+
+
+first_order_jac = _jacobian_function(_first_order_jac_kernel, "first order")
+
+
+@njit(MODEL_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _second_order_kernel(time_in, inv_rt, arrhen, e_activ, out):
+    """Fill out with second order alpha values in one fused loop."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        out[i] = my_kt / (1.0 + my_kt)
+
+
+second_order = _model_function(
+    _second_order_kernel, "Return second order fit of data.")
+
+
+@njit(JAC_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _second_order_jac_kernel(time_in, inv_rt, arrhen, e_activ, jac):
+    """Fill jac with second order d(alpha)/d(ln A, Ea) per point."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        dalpha_dlnk = my_kt / ((1.0 + my_kt) * (1.0 + my_kt))
+        jac[i, 0] = dalpha_dlnk
+        jac[i, 1] = -dalpha_dlnk * my_inv_rt
+
+
+second_order_jac = _jacobian_function(_second_order_jac_kernel, "second order")
 
-def avrami_erofeyev_2(inputs, arrhen, e_activ):
-    """
-    Return Avrami Erofeyev 2 fit of data, alpha = 1- exp(-(k * t) ^ 3).
 
-    Parameters
-    ----------
-    inputs : Input parameters for fit (time (seconds), Temp. (Kelvin))
-    arrhen : Arrhenius prefactor.
-    e_activ : Activation energy in kcal/mol.
+@njit(MODEL_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _third_order_kernel(time_in, inv_rt, arrhen, e_activ, out):
+    """Fill out with third order alpha values in one fused loop."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        out[i] = 1.0 - 1.0 / math.sqrt(abs(1.0 + 2.0 * my_kt))
+
+
+third_order = _model_function(
+    _third_order_kernel, "Return third order fit of data.")
+
 
-    """
-    time_in, temp = inputs
-    my_k = arrhen * np.exp(-1 * e_activ / (ID_GAS_CONST * temp))
-    return 1 - np.exp(-(my_k * time_in) ** 3)
+@njit(JAC_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _third_order_jac_kernel(time_in, inv_rt, arrhen, e_activ, jac):
+    """Fill jac with third order d(alpha)/d(ln A, Ea) per point."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        my_v = 1.0 + 2.0 * my_kt
+        dalpha_dlnk = my_kt / (my_v * math.sqrt(abs(my_v)))
+        jac[i, 0] = dalpha_dlnk
+        jac[i, 1] = -dalpha_dlnk * my_inv_rt
+
+
+third_order_jac = _jacobian_function(_third_order_jac_kernel, "third order")
+
+
+@njit(MODEL_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _avrami_erofeyev_1_kernel(time_in, inv_rt, arrhen, e_activ, out):
+    """Fill out with Avrami Erofeyev 1 alpha values in one fused loop."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        out[i] = 1.0 - math.exp(-(my_kt * my_kt))
+
+
+avrami_erofeyev_1 = _model_function(
+    _avrami_erofeyev_1_kernel,
+    "Return Avrami Erofeyev 1 fit of data, "
+    "alpha = 1- exp(-(k * t) ^ 2).")
 
 
-def avrami_erofeyev_3(inputs, arrhen, e_activ):
-    """
-    Return Avrami Erofeyev 3 fit of data, alpha = 1- exp(-(k * t) ^ 4).
+@njit(JAC_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _avrami_erofeyev_1_jac_kernel(time_in, inv_rt, arrhen, e_activ, jac):
+    """Fill jac with Avrami Erofeyev 1 d(alpha)/d(ln A, Ea) per point."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        my_u = my_kt * my_kt
+        dalpha_dlnk = 2.0 * my_u * math.exp(-my_u)
+        jac[i, 0] = dalpha_dlnk
+        jac[i, 1] = -dalpha_dlnk * my_inv_rt
+
+
+avrami_erofeyev_1_jac = _jacobian_function(
+    _avrami_erofeyev_1_jac_kernel, "Avrami Erofeyev 1")
+
+
+@njit(MODEL_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _avrami_erofeyev_2_kernel(time_in, inv_rt, arrhen, e_activ, out):
+    """Fill out with Avrami Erofeyev 2 alpha values in one fused loop."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        out[i] = 1.0 - math.exp(-(my_kt * my_kt * my_kt))
+
+
+avrami_erofeyev_2 = _model_function(
+    _avrami_erofeyev_2_kernel,
+    "Return Avrami Erofeyev 2 fit of data, "
+    "alpha = 1- exp(-(k * t) ^ 3).")
+
+
+@njit(JAC_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _avrami_erofeyev_2_jac_kernel(time_in, inv_rt, arrhen, e_activ, jac):
+    """Fill jac with Avrami Erofeyev 2 d(alpha)/d(ln A, Ea) per point."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        my_u = my_kt * my_kt * my_kt
+        dalpha_dlnk = 3.0 * my_u * math.exp(-my_u)
+        jac[i, 0] = dalpha_dlnk
+        jac[i, 1] = -dalpha_dlnk * my_inv_rt
+
+
+avrami_erofeyev_2_jac = _jacobian_function(
+    _avrami_erofeyev_2_jac_kernel, "Avrami Erofeyev 2")
+
+
+@njit(MODEL_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _avrami_erofeyev_3_kernel(time_in, inv_rt, arrhen, e_activ, out):
+    """Fill out with Avrami Erofeyev 3 alpha values in one fused loop."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        out[i] = 1.0 - math.exp(-((my_kt * my_kt) * (my_kt * my_kt)))
+
+
+avrami_erofeyev_3 = _model_function(
+    _avrami_erofeyev_3_kernel,
+    "Return Avrami Erofeyev 3 fit of data, "
+    "alpha = 1- exp(-(k * t) ^ 4).")
+
+
+@njit(JAC_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _avrami_erofeyev_3_jac_kernel(time_in, inv_rt, arrhen, e_activ, jac):
+    """Fill jac with Avrami Erofeyev 3 d(alpha)/d(ln A, Ea) per point."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        my_u = (my_kt * my_kt) * (my_kt * my_kt)
+        dalpha_dlnk = 4.0 * my_u * math.exp(-my_u)
+        jac[i, 0] = dalpha_dlnk
+        jac[i, 1] = -dalpha_dlnk * my_inv_rt
+
+
+avrami_erofeyev_3_jac = _jacobian_function(
+    _avrami_erofeyev_3_jac_kernel, "Avrami Erofeyev 3")
+
+
+@njit(MODEL_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _avrami_erofeyev_4_kernel(time_in, inv_rt, arrhen, e_activ, out):
+    """Fill out with Avrami Erofeyev 4 alpha values in one fused loop."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        out[i] = 1.0 - math.exp(-(my_kt ** (2 / 3)))
+
+
+avrami_erofeyev_4 = _model_function(
+    _avrami_erofeyev_4_kernel,
+    "Return Avrami Erofeyev 4 fit of data, "
+    "alpha = 1- exp(-(k * t) ^ (2 / 3)).")
+
+
+@njit(JAC_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _avrami_erofeyev_4_jac_kernel(time_in, inv_rt, arrhen, e_activ, jac):
+    """Fill jac with Avrami Erofeyev 4 d(alpha)/d(ln A, Ea) per point."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        my_u = my_kt ** (2 / 3)
+        dalpha_dlnk = (2 / 3) * my_u * math.exp(-my_u)
+        jac[i, 0] = dalpha_dlnk
+        jac[i, 1] = -dalpha_dlnk * my_inv_rt
+
+
+avrami_erofeyev_4_jac = _jacobian_function(
+    _avrami_erofeyev_4_jac_kernel, "Avrami Erofeyev 4")
+
+
+@njit(MODEL_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _twothird_power_law_kernel(time_in, inv_rt, arrhen, e_activ, out):
+    """Fill out with (2/3) power law alpha values in one fused loop."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        out[i] = my_kt ** (2 / 3)
+
+
+twothird_power_law = _model_function(
+    _twothird_power_law_kernel, "Return (2/3) power law fit of data.")
+
+
+@njit(JAC_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _twothird_power_law_jac_kernel(time_in, inv_rt, arrhen, e_activ, jac):
+    """Fill jac with (2/3) power law d(alpha)/d(ln A, Ea) per point."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        dalpha_dlnk = (2 / 3) * my_kt ** (2 / 3)
+        jac[i, 0] = dalpha_dlnk
+        jac[i, 1] = -dalpha_dlnk * my_inv_rt
+
+
+twothird_power_law_jac = _jacobian_function(
+    _twothird_power_law_jac_kernel, "(2/3) power law")
+
+
+@njit(MODEL_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _quadratic_power_law_kernel(time_in, inv_rt, arrhen, e_activ, out):
+    """Fill out with quadratic power law alpha values in one fused loop."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        out[i] = my_kt * my_kt
+
+
+quadratic_power_law = _model_function(
+    _quadratic_power_law_kernel, "Return quadratic power law fit of data.")
+
+
+@njit(JAC_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _quadratic_power_law_jac_kernel(time_in, inv_rt, arrhen, e_activ, jac):
+    """Fill jac with quadratic power law d(alpha)/d(ln A, Ea) per point."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        dalpha_dlnk = 2.0 * my_kt * my_kt
+        jac[i, 0] = dalpha_dlnk
+        jac[i, 1] = -dalpha_dlnk * my_inv_rt
 
-    Parameters
-    ----------
-    inputs : Input parameters for fit (time (seconds), Temp. (Kelvin))
-    arrhen : Arrhenius prefactor.
-    e_activ : Activation energy in kcal/mol.
 
-    """
-    time_in, temp = inputs
-    my_k = arrhen * np.exp(-1 * e_activ / (ID_GAS_CONST * temp))
-    return 1 - np.exp(-(my_k * time_in) ** 4)
+quadratic_power_law_jac = _jacobian_function(
+    _quadratic_power_law_jac_kernel, "quadratic power law")
 
 
-def avrami_erofeyev_4(inputs, arrhen, e_activ):
-    """
-    Return Avrami Erofeyev 4 fit of data, alpha = 1- exp(-(k * t) ^ (2 / 3)).
+@njit(MODEL_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _cubic_power_law_kernel(time_in, inv_rt, arrhen, e_activ, out):
+    """Fill out with cubic power law alpha values in one fused loop."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        my_v = 2.0 * my_kt
+        out[i] = my_v * math.sqrt(my_v)
 
-    Parameters
-    ----------
-    inputs : Input parameters for fit (time (seconds), Temp. (Kelvin))
-    arrhen : Arrhenius prefactor.
-    e_activ : Activation energy in kcal/mol.
 
-    """
-    time_in, temp = inputs
-    my_k = arrhen * np.exp(-e_activ / (ID_GAS_CONST * temp))
-    return 1 - np.exp(-(my_k * time_in) ** (2 / 3))
+cubic_power_law = _model_function(
+    _cubic_power_law_kernel, "Return cubic power law fit of data.")
+
 
+@njit(JAC_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _cubic_power_law_jac_kernel(time_in, inv_rt, arrhen, e_activ, jac):
+    """Fill jac with cubic power law d(alpha)/d(ln A, Ea) per point."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        my_v = 2.0 * my_kt
+        dalpha_dlnk = (3 / 2) * my_v * math.sqrt(my_v)
+        jac[i, 0] = dalpha_dlnk
+        jac[i, 1] = -dalpha_dlnk * my_inv_rt
 
-def twothird_power_law(inputs, arrhen, e_activ):
-    """
-    Return (2/3) power law fit of data.
 
-    Parameters
-    ----------
-    inputs : Input parameters for fit (time (seconds), Temp. (Kelvin))
-    arrhen : Arrhenius prefactor.
-    e_activ : Activation energy in kcal/mol.
+cubic_power_law_jac = _jacobian_function(
+    _cubic_power_law_jac_kernel, "cubic power law")
 
-    """
-    time_in, temp = inputs
-    my_k = arrhen * np.exp(-1 * e_activ / (ID_GAS_CONST * temp))
-    return (my_k * time_in) ** (2 / 3)
 
+@njit(MODEL_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _quartic_power_law_kernel(time_in, inv_rt, arrhen, e_activ, out):
+    """Fill out with quartic power law alpha values in one fused loop."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        out[i] = (3.0 * my_kt) ** (4 / 3)
 
-def quadratic_power_law(inputs, arrhen, e_activ):
-    """
-    Return quadratic power law fit of data.
 
-    Parameters
-    ----------
-    inputs : Input parameters for fit (time (seconds), Temp. (Kelvin))
-    arrhen : Arrhenius prefactor.
-    e_activ : Activation energy in kcal/mol.
+quartic_power_law = _model_function(
+    _quartic_power_law_kernel, "Return quartic power law fit of data.")
 
-    """
-    time_in, temp = inputs
-    my_k = arrhen * np.exp(-1 * e_activ / (ID_GAS_CONST * temp))
-    return (my_k * time_in) ** (2)
 
+@njit(JAC_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _quartic_power_law_jac_kernel(time_in, inv_rt, arrhen, e_activ, jac):
+    """Fill jac with quartic power law d(alpha)/d(ln A, Ea) per point."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        dalpha_dlnk = (4 / 3) * (3.0 * my_kt) ** (4 / 3)
+        jac[i, 0] = dalpha_dlnk
+        jac[i, 1] = -dalpha_dlnk * my_inv_rt
 
-def cubic_power_law(inputs, arrhen, e_activ):
-    """
-    Return cubic power law fit of data.
 
-    Parameters
-    ----------
-    inputs : Input parameters for fit (time (seconds), Temp. (Kelvin))
-    arrhen : Arrhenius prefactor.
-    e_activ : Activation energy in kcal/mol.
+quartic_power_law_jac = _jacobian_function(
+    _quartic_power_law_jac_kernel, "quartic power law")
+
+
+@njit(MODEL_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _contracting_area_kernel(time_in, inv_rt, arrhen, e_activ, out):
+    """Fill out with contracting area alpha values in one fused loop."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        out[i] = 2.0 * my_kt - my_kt * my_kt
+
+
+contracting_area = _model_function(
+    _contracting_area_kernel, "Return contracting area fit of data.")
+
+
+@njit(JAC_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _contracting_area_jac_kernel(time_in, inv_rt, arrhen, e_activ, jac):
+    """Fill jac with contracting area d(alpha)/d(ln A, Ea) per point."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        dalpha_dlnk = 2.0 * my_kt - 2.0 * my_kt * my_kt
+        jac[i, 0] = dalpha_dlnk
+        jac[i, 1] = -dalpha_dlnk * my_inv_rt
+
+
+contracting_area_jac = _jacobian_function(
+    _contracting_area_jac_kernel, "contracting area")
+
+
+@njit(MODEL_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _contracting_volume_kernel(time_in, inv_rt, arrhen, e_activ, out):
+    """Fill out with contracting volume alpha values in one fused loop."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        my_w = abs(1.0 - 2.0 * my_kt)
+        out[i] = 1.0 - my_w * math.sqrt(my_w)
+
+
+contracting_volume = _model_function(
+    _contracting_volume_kernel, "Return contracting volume fit of data.")
+
+
+@njit(JAC_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _contracting_volume_jac_kernel(time_in, inv_rt, arrhen, e_activ, jac):
+    """Fill jac with contracting volume d(alpha)/d(ln A, Ea) per point."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        my_v = 1.0 - 2.0 * my_kt
+        dalpha_dlnk = (3.0 * my_kt
+                       * math.copysign(math.sqrt(abs(my_v)), my_v))
+        jac[i, 0] = dalpha_dlnk
+        jac[i, 1] = -dalpha_dlnk * my_inv_rt
+
+
+contracting_volume_jac = _jacobian_function(
+    _contracting_volume_jac_kernel, "contracting volume")
+
+
+@njit(MODEL_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _onedimension_diffusion_kernel(time_in, inv_rt, arrhen, e_activ, out):
+    """Fill out with 1D diffusion alpha values in one fused loop."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        out[i] = math.sqrt(my_kt)
+
+
+onedimension_diffusion = _model_function(
+    _onedimension_diffusion_kernel, "Return 1D diffusion fit of data.")
 
-    """
-    time_in, temp = inputs
-    my_k = arrhen * np.exp(-1 * e_activ / (ID_GAS_CONST * temp))
-    return (2 * my_k * time_in) ** (3 / 2)
 
+@njit(JAC_KERNEL_SIGNATURE, fastmath=FASTMATH_FLAGS, cache=CACHE_KERNELS)
+def _onedimension_diffusion_jac_kernel(time_in, inv_rt, arrhen, e_activ, jac):
+    """Fill jac with 1D diffusion d(alpha)/d(ln A, Ea) per point."""
+    my_inv_rt, my_k = _rate_constant(inv_rt, 0, arrhen, e_activ)
+    for i in range(time_in.size):
+        if inv_rt.size > 1:
+            my_inv_rt, my_k = _rate_constant(inv_rt, i, arrhen, e_activ)
+        my_kt = my_k * time_in[i]
+        dalpha_dlnk = 0.5 * math.sqrt(my_kt)
+        jac[i, 0] = dalpha_dlnk
+        jac[i, 1] = -dalpha_dlnk * my_inv_rt
 
-def quartic_power_law(inputs, arrhen, e_activ):
+
+onedimension_diffusion_jac = _jacobian_function(
+    _onedimension_diffusion_jac_kernel, "1D diffusion")
+
+
+def load_csv(path):
     """
-    Return quartic power law fit of data.
+    Return experimental data columns read from a data CSV file.
 
     Parameters
     ----------
-    inputs : Input parameters for fit (time (seconds), Temp. (Kelvin))
-    arrhen : Arrhenius prefactor.
-    e_activ : Activation energy in kcal/mol.
-
-    """
-    time_in, temp = inputs
-    my_k = arrhen * np.exp(-1 * e_activ / (ID_GAS_CONST * temp))
-    return (3 * my_k * time_in) ** (4 / 3)
+    path : Path to the data CSV file.
 
+    Returns
+    -------
+    (time_data, initmol_data, temp_data, finalmol_data, number of points)
 
-def contracting_area(inputs, arrhen, e_activ):
     """
-    Return contracting area fit of data.
+    # Columns are picked out by header name, so their order in the file
+    # does not matter.
+    with open(path, encoding='utf-8-sig', newline='') as csv_file:
+        header = [name.strip()
+                  for name in next(csv.reader([csv_file.readline()]), [])]
+        missing = [name for name in CSV_COLUMNS if name not in header]
+        if missing:
+            raise ValueError(path + " is missing the column(s) "
+                             + ", ".join(missing))
+        table = np.loadtxt(csv_file, delimiter=',', dtype=np.float64,
+                           usecols=[header.index(name)
+                                    for name in CSV_COLUMNS], ndmin=2)
+    time_data, initmol_data, temp_data, finalmol_data = \
+        np.ascontiguousarray(table.T)
+    return (time_data, initmol_data, temp_data, finalmol_data,
+            table.shape[0])
+
+
+def fit_model(model, model_jac, inputs, alpha_in):
+    """
+    Return best fit parameters and their covariance for a kinetic model.
 
     Parameters
     ----------
-    inputs : Input parameters for fit (time (seconds), Temp. (Kelvin))
-    arrhen : Arrhenius prefactor.
-    e_activ : Activation energy in kcal/mol.
+    model : Kinetic model function, e.g. first_order.
+    model_jac : Analytic Jacobian of model w.r.t. (ln A, Ea), e.g.
+                first_order_jac.
+    inputs : Input parameters for fit (time (seconds),
+             1 / (R * Temp.) (mol/kcal))
+    alpha_in : Measured reaction progress fraction at each input point.
+
+    Returns
+    -------
+    (params, params_covariance, ssr): the parameters and covariance as
+    returned by scipy's curve_fit, and the sum of squared residuals at
+    the solution.
 
     """
-    time_in, temp = inputs
-    my_k = arrhen * np.exp(-1 * e_activ / (ID_GAS_CONST * temp))
-    return 2 * my_k * time_in - ((my_k * time_in) ** 2)
+    # Fit ln(A) rather than A, which keeps A positive and puts its orders
+    # of magnitude on an even footing.  The bounds keep both parameters
+    # physical and stop isothermal fits, where only k = A exp(-Ea / RT)
+    # is determined, from drifting off along the A-Ea ridge.
+    bounds = ([-100., 0.], [150., 200.])
+
+    def residuals(params):
+        # least_squares holds on to each residual vector, so reuse the
+        # fresh model output rather than a shared buffer.  np.exp gives
+        # inf on overflow, which least_squares backs away from.
+        res = model(inputs, np.exp(params[0]), params[1])
+        res -= alpha_in
+        return res
+
+    def jacobian(params):
+        return model_jac(inputs, np.exp(params[0]), params[1])
+
+    # Start at Ea = 10 kcal/mol with A putting k * t near 1 by the last
+    # time point, where every model still responds to both parameters.
+    e_activ_0 = 10.
+    log_arrhen_0 = np.clip(e_activ_0 * np.mean(inputs[1])
+                           - math.log(np.amax(inputs[0])),
+                           bounds[0][0], bounds[1][0])
+    result = optimize.least_squares(
+        residuals, [log_arrhen_0, e_activ_0], jac=jacobian, bounds=bounds,
+        method='trf', x_scale='jac', max_nfev=5000)
+    if result.status == 0:
+        warnings.warn(model.__name__ + " fit used up its function "
+                      + "evaluations without converging.", FitWarning)
+    # trf keeps its iterates strictly inside the bounds, so a fit pinned
+    # to one can stop just short of it without active_mask noticing.
+    at_bound = ((result.active_mask != 0)
+                | np.isclose(result.x, bounds[0], rtol=0., atol=1e-3)
+                | np.isclose(result.x, bounds[1], rtol=0., atol=1e-3))
+    for name, active in zip(('ln A', 'Ea'), at_bound):
+        if active:
+            warnings.warn(model.__name__ + " fit ended on its " + name
+                          + " bound, so its covariance is not "
+                          + "meaningful.", FitWarning)
+    # Covariance from the Jacobian at the solution, computed the same way
+    # curve_fit does it, then carried from ln(A) back over to A.
+    _, sing_vals, vt_mat = np.linalg.svd(result.jac, full_matrices=False)
+    threshold = (np.finfo(float).eps * max(result.jac.shape)
+                 * sing_vals[0])
+    vt_mat = vt_mat[:np.count_nonzero(sing_vals > threshold)]
+    sing_vals = sing_vals[:vt_mat.shape[0]]
+    params_covariance = np.dot(vt_mat.T / sing_vals ** 2, vt_mat)
+    params = np.array([np.exp(result.x[0]), result.x[1]])
+    params_covariance[0] *= params[0]
+    params_covariance[:, 0] *= params[0]
+    dof = alpha_in.size - result.x.size
+    if dof > 0:
+        params_covariance *= 2 * result.cost / dof
+    else:
+        params_covariance.fill(np.inf)
+    return params, params_covariance, 2 * result.cost
 
 
-def contracting_volume(inputs, arrhen, e_activ):
+def load_data(path):
     """
-    Return contracting volume fit of data.
+    Return a data CSV file's columns along with the derived fit inputs.
 
     Parameters
     ----------
-    inputs : Input parameters for fit (time (seconds), Temp. (Kelvin))
-    arrhen : Arrhenius prefactor.
-    e_activ : Activation energy in kcal/mol.
-
-    """
-    time_in, temp = inputs
-    my_k = arrhen * np.exp(-1 * e_activ / (ID_GAS_CONST * temp))
-    return 1 - (np.abs(1 - 2 * my_k * time_in) ** (3 / 2))
+    path : Path to the data CSV file.
 
+    Returns
+    -------
+    SimpleNamespace holding the CSV columns, num_points, alpha, avgtemp,
+    the 1 / RT values of the data and of avgtemp, whether the data is
+    isothermal, the fit_inputs tuple, the mytime grid and plot_inputs for
+    the fit curve, the plotalpha and mysol plot buffers and a data_id
+    fingerprint of the fitted values.
 
-def onedimension_diffusion(inputs, arrhen, e_activ):
     """
-    Return 1D diffusion fit of data.
+    time_data, initmol_data, temp_data, finalmol_data, num_points = \
+        load_csv(path)
+    avgtemp = np.average(temp_data)
+    inv_rt_data = 1.0 / (ID_GAS_CONST * temp_data)
+    inv_rt_avg = 1.0 / (ID_GAS_CONST * avgtemp)
+    # Isothermal data shares one rate constant across all points, so fit
+    # with a single 1 / RT value.
+    isothermal = np.ptp(temp_data) < 1e-6
+    # The fitted time, 1 / RT and alpha values are views into one
+    # contiguous block, so the fit streams through adjacent memory.
+    fit_block = np.concatenate((
+        time_data, inv_rt_data[:1] if isothermal else inv_rt_data,
+        finalmol_data / initmol_data)).astype(FIT_DTYPE, copy=False)
+    fit_time, fit_inv_rt, alpha = np.split(
+        fit_block, [num_points, fit_block.size - num_points])
+    mytime = np.linspace(0., np.amax(time_data), num_points)
+    return SimpleNamespace(
+        time_data=time_data, initmol_data=initmol_data, temp_data=temp_data,
+        finalmol_data=finalmol_data, num_points=num_points,
+        mytime=mytime,
+        plot_inputs=(mytime.astype(FIT_DTYPE, copy=False),
+                     np.full(1, inv_rt_avg, dtype=FIT_DTYPE)),
+        avgtemp=avgtemp,
+        inv_rt_data=inv_rt_data, inv_rt_avg=inv_rt_avg,
+        inv_rt_offset=inv_rt_data - inv_rt_avg,
+        isothermal=isothermal,
+        fit_inputs=(fit_time, fit_inv_rt),
+        alpha=alpha, plotalpha=np.empty_like(alpha),
+        mysol=np.empty(num_points, dtype=FIT_DTYPE),
+        data_id=hash((time_data.tobytes(), inv_rt_data.tobytes(),
+                      alpha.tobytes())))
+
+
+def fit_all_models(inputs, alpha_in, model_numbers):
+    """
+    Return fits of the given MODELS entries, run in parallel processes.
 
     Parameters
     ----------
-    inputs : Input parameters for fit (time (seconds), Temp. (Kelvin))
-    arrhen : Arrhenius prefactor.
-    e_activ : Activation energy in kcal/mol.
+    inputs : Input parameters for fit (time (seconds),
+             1 / (R * Temp.) (mol/kcal))
+    alpha_in : Measured reaction progress fraction at each input point.
+    model_numbers : Non-empty list of MODELS keys to fit.
+
+    Returns
+    -------
+    Dict mapping each model number to its (params, params_covariance,
+    ssr).
 
     """
-    time_in, temp = inputs
-    my_k = arrhen * np.exp(-1 * e_activ / (ID_GAS_CONST * temp))
-    return np.sqrt(my_k * time_in)
+    with ProcessPoolExecutor(
+            max_workers=min(len(model_numbers),
+                            os.cpu_count() or 1)) as executor:
+        futures = {cmd: executor.submit(fit_model, MODELS[cmd][1],
+                                        MODELS[cmd][2], inputs, alpha_in)
+                   for cmd in model_numbers}
+    return {cmd: future.result() for cmd, future in futures.items()}
+
+
+def wait_for_plot_save():
+    """Block until the last plot queued by plot_model is written."""
+    if PLOT_SAVES:
+        PLOT_SAVES.pop().result()
 
 
 def plot_model(selected_model_name):
     """Produce plot of fit and print fit parameters."""
-    plt.figure(figsize=(12, 9))
-    plt.clf()
-    plt.scatter(time_data, plotalpha)
-    plt.plot(mytime, mysol, color='b', linewidth=1.5, linestyle='-')
-    plt.axis([0, np.amax(mytime) * 1.1, 0, np.amax(mysol) + 0.025])
-    plt.xlabel('t (seconds)')
-    plt.ylabel('Reaction progress fraction')
-    plt.grid(True)
-    plt.title(selected_model_name + " Curve Fit")
-    plt.savefig(selected_model_name + "_CurveFit.png", dpi=400)
-    plt.draw()
-    plt.show()
+    # The figure is reused, so let the previous save finish drawing it.
+    wait_for_plot_save()
+    fig = plt.figure('Curve fit', figsize=(12, 9))
+    ax = fig.gca()
+    ax.cla()
+    ax.scatter(data.time_data, data.plotalpha)
+    ax.plot(data.mytime, data.mysol, color='b', linewidth=1.5,
+            linestyle='-')
+    ax.axis([0, np.amax(data.mytime) * 1.1, 0, np.amax(data.mysol) + 0.025])
+    ax.set_xlabel('t (seconds)')
+    ax.set_ylabel('Reaction progress fraction')
+    ax.grid(True)
+    ax.set_title(selected_model_name + " Curve Fit")
+    PLOT_SAVES.append(PLOT_SAVER.submit(
+        fig.savefig, selected_model_name + "_CurveFit.png", dpi=200))
     print("A = ", params[0], "\nEa = ", params[1], " kcal/mol")
     return print("Var(A) = ", params_covariance[0, 0],
                  "\nVar(Ea) = ", params_covariance[1, 1],
@@ -275,45 +841,39 @@ def plot_model(selected_model_name):
 
 
 ID_GAS_CONST = 1.985877534 * (10 ** (-3))
-direc = input('Enter the full directory for your data CSV file: ')
-with open(direc) as csv_file:
-    csv_reader = csv.reader(csv_file, delimiter=',')
-    NUM_POINTS = 0
-    for row in csv_reader:
-        if NUM_POINTS == 0:
-            NUM_POINTS += 1
-        else:
-            NUM_POINTS += 1
-my_csv_data = pd.read_csv(direc)
-time_data = []
-for i in range(0, NUM_POINTS - 1):
-    time_data.append(my_csv_data['time_data'][i])
-time_data = np.array(time_data)
-mytime = np.linspace(0., np.amax(time_data), NUM_POINTS)
-initmol_data = []
-for i in range(0, NUM_POINTS - 1):
-    initmol_data.append(my_csv_data['initmol_data'][i])
-initmol_data = np.array(initmol_data)
-temp_data = []
-for i in range(0, NUM_POINTS - 1):
-    temp_data.append(my_csv_data['temp_data'][i])
-temp_data = np.array(temp_data)
-avgtemp = np.average(temp_data)
-plottemp_data = np.empty_like(temp_data)
-plottemp_data[:] = avgtemp
-finalmol_data = []
-for i in range(0, NUM_POINTS - 1):
-    finalmol_data.append(my_csv_data['finalmol_data'][i])
-finalmol_data = np.array(finalmol_data)
-alpha = finalmol_data / initmol_data
-plotalpha = np.empty_like(alpha)
-mysol = np.empty_like(alpha)
-myy = np.empty_like(finalmol_data)
-USERCONTINUE = True
-print('')
-
-while USERCONTINUE:
-    cmd = int(input("Now input the number of the model you want to use with "
+MODELS = {
+    1: ('Zero-order', zero_order, zero_order_jac),
+    2: ('First-order', first_order, first_order_jac),
+    3: ('Second-order', second_order, second_order_jac),
+    4: ('Third-order', third_order, third_order_jac),
+    5: ('Avrami-Erofeyev 1', avrami_erofeyev_1, avrami_erofeyev_1_jac),
+    6: ('Avrami-Erofeyev 2', avrami_erofeyev_2, avrami_erofeyev_2_jac),
+    7: ('Avrami-Erofeyev 3', avrami_erofeyev_3, avrami_erofeyev_3_jac),
+    8: ('Avrami-Erofeyev 4', avrami_erofeyev_4, avrami_erofeyev_4_jac),
+    9: ('Two-third power law', twothird_power_law, twothird_power_law_jac),
+    10: ('Quadratic power law', quadratic_power_law, quadratic_power_law_jac),
+    11: ('Cubic power law', cubic_power_law, cubic_power_law_jac),
+    12: ('Quartic power law', quartic_power_law, quartic_power_law_jac),
+    13: ('Contracting area', contracting_area, contracting_area_jac),
+    14: ('Contracting volume', contracting_volume, contracting_volume_jac),
+    15: ('1D diffusion', onedimension_diffusion, onedimension_diffusion_jac)}
+CSV_COLUMNS = ['time_data', 'initmol_data', 'temp_data', 'finalmol_data']
+# Plots are rendered to PNG on a background thread so the prompt returns
+# while the file is written; PLOT_SAVES holds the pending save, if any.
+PLOT_SAVER = ThreadPoolExecutor(max_workers=1)
+PLOT_SAVES = []
+
+if __name__ == '__main__':
+    freeze_support()
+    direc = input('Enter the full directory for your data CSV file: ')
+    data = load_data(direc)
+    # Fits already done this session, keyed on (model number, data_id).
+    fit_cache = {}
+    USERCONTINUE = True
+    print('')
+
+    while USERCONTINUE:
+        cmd = input("Now input the number of the model you want to use with "
                     + "your data, e.g., enter 1 for zero-order: "
                     + "\n1 zero-order, 2 first-order, 3 second-order, "
                     + "4 third-order, 5 Avrami-Erofeyev 1,"
@@ -321,235 +881,56 @@ while USERCONTINUE:
                     + "8 Avrami-Erofeyev 4, 9 2/3 power law, "
                     + "10 quadratic power law, \n11 cubic power law, "
                     + "12 quartic power law, 13 contracting area, "
-                    + "14 contracting volume, 15 1-D diffusion: "))
-    if cmd == 1:
-        MODEL_NAME = 'Zero-order'
-        params, params_covariance = optimize.curve_fit(zero_order,
-                                                       (time_data, temp_data),
-                                                       alpha, p0=[100, 10],
-                                                       maxfev=100000)
-        for i in range(0, NUM_POINTS - 1):
-            plotalpha[i] = alpha[i] * np.exp((params[1] / ID_GAS_CONST)
-                                             * ((1 / temp_data[i])
-                                                - (1 / avgtemp)))
-        mysol = zero_order((mytime, avgtemp), params[0], params[1])
-        plot_model(MODEL_NAME)
-    elif cmd == 2:
-        MODEL_NAME = 'First-order'
-        params, params_covariance = optimize.curve_fit(first_order,
-                                                       (time_data, temp_data),
-                                                       alpha, p0=[100, 10],
-                                                       maxfev=100000)
-        for i in range(0, NUM_POINTS - 1):
-            plotalpha[i] = alpha[i] * np.exp((params[1] / ID_GAS_CONST)
-                                             * ((1 / temp_data[i])
-                                                - (1 / avgtemp)))
-        mysol = first_order((mytime, avgtemp), params[0], params[1])
-        plot_model(MODEL_NAME)
-    elif cmd == 3:
-        MODEL_NAME = 'Second-order'
-        params, params_covariance = optimize.curve_fit(second_order,
-                                                       (time_data, temp_data),
-                                                       alpha, p0=[100, 10],
-                                                       maxfev=100000)
-        for i in range(0, NUM_POINTS - 1):
-            plotalpha[i] = alpha[i] * np.exp((params[1] / ID_GAS_CONST)
-                                             * ((1 / temp_data[i])
-                                                - (1 / avgtemp)))
-        mysol = second_order((mytime, avgtemp), params[0], params[1])
-        plot_model(MODEL_NAME)
-    elif cmd == 4:
-        MODEL_NAME = 'Third-order'
-        params, params_covariance = optimize.curve_fit(third_order,
-                                                       (time_data, temp_data),
-                                                       alpha, p0=[100, 10],
-                                                       maxfev=100000)
-        for i in range(0, NUM_POINTS - 1):
-            plotalpha[i] = alpha[i] * np.exp((params[1] / ID_GAS_CONST)
-                                             * ((1 / temp_data[i])
-                                                - (1 / avgtemp)))
-        mysol = third_order((mytime, avgtemp), params[0], params[1])
-        plot_model(MODEL_NAME)
-    elif cmd == 5:
-        MODEL_NAME = 'Avrami-Erofeyev 1'
-        params, params_covariance = optimize.curve_fit(avrami_erofeyev_1,
-                                                       (time_data, temp_data),
-                                                       alpha, p0=[100, 10],
-                                                       maxfev=100000)
-        for i in range(0, NUM_POINTS - 1):
-            plotalpha[i] = alpha[i] * np.exp((params[1] / ID_GAS_CONST)
-                                             * ((1 / temp_data[i])
-                                                - (1 / avgtemp)))
-        mysol = avrami_erofeyev_1((mytime, avgtemp), params[0], params[1])
-        plot_model(MODEL_NAME)
-    elif cmd == 6:
-        MODEL_NAME = 'Avrami-Erofeyev 2'
-        params, params_covariance = optimize.curve_fit(avrami_erofeyev_2,
-                                                       (time_data, temp_data),
-                                                       alpha, p0=[100, 10],
-                                                       maxfev=100000)
-        for i in range(0, NUM_POINTS - 1):
-            plotalpha[i] = alpha[i] * np.exp((params[1] / ID_GAS_CONST)
-                                             * ((1 / temp_data[i])
-                                                - (1 / avgtemp)))
-        mysol = avrami_erofeyev_2((mytime, avgtemp), params[0], params[1])
-        plot_model(MODEL_NAME)
-    elif cmd == 7:
-        MODEL_NAME = 'Avrami-Erofeyev 3'
-        params, params_covariance = optimize.curve_fit(avrami_erofeyev_3,
-                                                       (time_data, temp_data),
-                                                       alpha, p0=[100, 10],
-                                                       maxfev=100000)
-        for i in range(0, NUM_POINTS - 1):
-            plotalpha[i] = alpha[i] * np.exp((params[1] / ID_GAS_CONST)
-                                             * ((1 / temp_data[i])
-                                                - (1 / avgtemp)))
-        mysol = avrami_erofeyev_3((mytime, avgtemp), params[0], params[1])
-        plot_model(MODEL_NAME)
-    elif cmd == 8:
-        MODEL_NAME = 'Avrami-Erofeyev 4'
-        params, params_covariance = optimize.curve_fit(avrami_erofeyev_4,
-                                                       (time_data, temp_data),
-                                                       alpha, p0=[100, 10],
-                                                       maxfev=100000)
-        for i in range(0, NUM_POINTS - 1):
-            plotalpha[i] = alpha[i] * np.exp((params[1] / ID_GAS_CONST)
-                                             * ((1 / temp_data[i])
-                                                - (1 / avgtemp)))
-        mysol = avrami_erofeyev_4((mytime, avgtemp), params[0], params[1])
-        plot_model(MODEL_NAME)
-    elif cmd == 9:
-        MODEL_NAME = 'Two-third power law'
-        params, params_covariance = optimize.curve_fit(twothird_power_law,
-                                                       (time_data, temp_data),
-                                                       alpha, p0=[100, 10],
-                                                       maxfev=100000)
-        for i in range(0, NUM_POINTS - 1):
-            plotalpha[i] = alpha[i] * np.exp((params[1] / ID_GAS_CONST)
-                                             * ((1 / temp_data[i])
-                                                - (1 / avgtemp)))
-        mysol = twothird_power_law((mytime, avgtemp), params[0], params[1])
-        plot_model(MODEL_NAME)
-    elif cmd == 10:
-        MODEL_NAME = 'Quadratic power law'
-        params, params_covariance = optimize.curve_fit(quadratic_power_law,
-                                                       (time_data, temp_data),
-                                                       alpha, p0=[100, 10],
-                                                       maxfev=100000)
-        for i in range(0, NUM_POINTS - 1):
-            plotalpha[i] = alpha[i] * np.exp((params[1] / ID_GAS_CONST)
-                                             * ((1 / temp_data[i])
-                                                - (1 / avgtemp)))
-        mysol = quadratic_power_law((mytime, avgtemp), params[0], params[1])
-        plot_model(MODEL_NAME)
-    elif cmd == 11:
-        MODEL_NAME = 'Cubic power law'
-        params, params_covariance = optimize.curve_fit(cubic_power_law,
-                                                       (time_data, temp_data),
-                                                       alpha, p0=[100, 10],
-                                                       maxfev=100000)
-        for i in range(0, NUM_POINTS - 1):
-            plotalpha[i] = alpha[i] * np.exp((params[1] / ID_GAS_CONST)
-                                             * ((1 / temp_data[i])
-                                                - (1 / avgtemp)))
-        mysol = cubic_power_law((mytime, avgtemp), params[0], params[1])
-        plot_model(MODEL_NAME)
-    elif cmd == 12:
-        MODEL_NAME = 'Quartic power law'
-        params, params_covariance = optimize.curve_fit(quartic_power_law,
-                                                       (time_data, temp_data),
-                                                       alpha, p0=[100, 10],
-                                                       maxfev=100000)
-        for i in range(0, NUM_POINTS - 1):
-            plotalpha[i] = alpha[i] * np.exp((params[1] / ID_GAS_CONST)
-                                             * ((1 / temp_data[i])
-                                                - (1 / avgtemp)))
-        mysol = quartic_power_law((mytime, avgtemp), params[0], params[1])
-        plot_model(MODEL_NAME)
-    elif cmd == 13:
-        MODEL_NAME = 'Contracting area'
-        params, params_covariance = optimize.curve_fit(contracting_area,
-                                                       (time_data, temp_data),
-                                                       alpha, p0=[100, 10],
-                                                       maxfev=100000)
-        for i in range(0, NUM_POINTS - 1):
-            plotalpha[i] = alpha[i] * np.exp((params[1] / ID_GAS_CONST)
-                                             * ((1 / temp_data[i])
-                                                - (1 / avgtemp)))
-        mysol = contracting_area((mytime, avgtemp), params[0], params[1])
-        plot_model(MODEL_NAME)
-    elif cmd == 14:
-        MODEL_NAME = 'Contracting volume'
-        params, params_covariance = optimize.curve_fit(contracting_volume,
-                                                       (time_data, temp_data),
-                                                       alpha, p0=[100, 10],
-                                                       maxfev=100000)
-        for i in range(0, NUM_POINTS - 1):
-            plotalpha[i] = alpha[i] * np.exp((params[1] / ID_GAS_CONST)
-                                             * ((1 / temp_data[i])
-                                                - (1 / avgtemp)))
-        mysol = contracting_volume((mytime, avgtemp), params[0], params[1])
-        plot_model(MODEL_NAME)
-    elif cmd == 15:
-        MODEL_NAME = '1D diffusion'
-        params, params_covariance = optimize.curve_fit(onedimension_diffusion,
-                                                       (time_data, temp_data),
-                                                       alpha, p0=[100, 10],
-                                                       maxfev=100000)
-        for i in range(0, NUM_POINTS - 1):
-            plotalpha[i] = alpha[i] * np.exp((params[1] / ID_GAS_CONST)
-                                             * ((1 / temp_data[i])
-                                                - (1 / avgtemp)))
-        mysol = onedimension_diffusion((mytime, avgtemp), params[0], params[1])
-        plot_model(MODEL_NAME)
-    else:
-        print("\nInvalid entry.\n")
-    print("\nYour plot should be saved in your current working directory.\n")
-    checkcontinue = input("Would you like to try again with the same data "
-                          + "or quit? Enter Y to continue with the same "
-                          + "data or N to stop, or enter C to change the "
-                          + "input file: ")
-    if checkcontinue in ('Y', 'y'):
-        USERCONTINUE = True
-        print('')
-    elif checkcontinue in ('N', 'n'):
-        USERCONTINUE = False
-    elif checkcontinue in ('C', 'c'):
-        direc = input('Enter the full directory for your data CSV file: ')
-        with open(direc) as csv_file:
-            csv_reader = csv.reader(csv_file, delimiter=',')
-            NUM_POINTS = 0
-            for row in csv_reader:
-                if NUM_POINTS == 0:
-                    NUM_POINTS += 1
-                else:
-                    NUM_POINTS += 1
-        my_csv_data = pd.read_csv(direc)
-        time_data = []
-        for i in range(0, NUM_POINTS - 1):
-            time_data.append(my_csv_data['time_data'][i])
-        time_data = np.array(time_data)
-        mytime = np.linspace(0., np.amax(time_data), NUM_POINTS)
-        initmol_data = []
-        for i in range(0, NUM_POINTS - 1):
-            initmol_data.append(my_csv_data['initmol_data'][i])
-        initmol_data = np.array(initmol_data)
-        temp_data = []
-        for i in range(0, NUM_POINTS - 1):
-            temp_data.append(my_csv_data['temp_data'][i])
-        temp_data = np.array(temp_data)
-        avgtemp = np.average(temp_data)
-        plottemp_data = np.empty_like(temp_data)
-        plottemp_data[:] = avgtemp
-        finalmol_data = []
-        for i in range(0, NUM_POINTS - 1):
-            finalmol_data.append(my_csv_data['finalmol_data'][i])
-        finalmol_data = np.array(finalmol_data)
-        alpha = finalmol_data / initmol_data
-        plotalpha = np.empty_like(alpha)
-        mysol = np.empty_like(alpha)
-        myy = np.empty_like(finalmol_data)
-    else:
-        USERCONTINUE = True
-        print("Invalid user input. Returning to model selection screen with "
-              + "same data.\n")
+                    + "14 contracting volume, 15 1-D diffusion, "
+                    + "\nor A to fit all models: ").strip()
+        if cmd in ('A', 'a'):
+            unfitted = [model_number for model_number in MODELS
+                        if (model_number, data.data_id) not in fit_cache]
+            if unfitted:
+                # Forking the workers while the saver thread is inside
+                # matplotlib could leave them holding its locks.
+                wait_for_plot_save()
+                for model_number, fit in fit_all_models(
+                        data.fit_inputs, data.alpha, unfitted).items():
+                    fit_cache[(model_number, data.data_id)] = fit
+            for model_number in MODELS:
+                params, _, model_ssr = fit_cache[(model_number,
+                                                  data.data_id)]
+                MODEL_NAME = MODELS[model_number][0]
+                print("\n" + MODEL_NAME + ":\nA = ", params[0],
+                      "\nEa = ", params[1], " kcal/mol",
+                      "\nSum of squared residuals = ", model_ssr)
+            print('')
+        elif cmd.isdigit() and int(cmd) in MODELS:
+            MODEL_NAME, model, model_jac = MODELS[int(cmd)]
+            fit_key = (int(cmd), data.data_id)
+            if fit_key not in fit_cache:
+                fit_cache[fit_key] = fit_model(model, model_jac,
+                                               data.fit_inputs, data.alpha)
+            params, params_covariance, _ = fit_cache[fit_key]
+            np.exp(params[1] * data.inv_rt_offset, out=data.plotalpha)
+            data.plotalpha *= data.alpha
+            model(data.plot_inputs, params[0], params[1], out=data.mysol)
+            plot_model(MODEL_NAME)
+            print("\nYour plot should be saved in your current working "
+                  + "directory.\n")
+        else:
+            print("\nInvalid entry.\n")
+        checkcontinue = input("Would you like to try again with the same "
+                              + "data or quit? Enter Y to continue with the "
+                              + "same data or N to stop, or enter C to "
+                              + "change the input file: ")
+        if checkcontinue in ('Y', 'y'):
+            USERCONTINUE = True
+            print('')
+        elif checkcontinue in ('N', 'n'):
+            USERCONTINUE = False
+        elif checkcontinue in ('C', 'c'):
+            direc = input('Enter the full directory for your data CSV '
+                          + 'file: ')
+            data = load_data(direc)
+        else:
+            USERCONTINUE = True
+            print("Invalid user input. Returning to model selection screen "
+                  + "with same data.\n")
+    wait_for_plot_save()